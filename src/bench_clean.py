@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""章节清洗校验与性能测试：python bench_clean.py [章节数]"""
+import random
+import sys
+import time
+
+from cleaner import AD_BANNERS, AD_MARKERS, DEFAULT_FILTERS, PARAGRAPH_SEP, ChapterCleaner, ChapterFilter, simplified_filter
+
+LONG_PARAGRAPH = "少年抬起头，望向远处连绵的群山，心中一片茫然。"
+DIALOGUE = "“这里不是你该来的地方，你还是早些回去吧。”老者缓缓说道。"
+
+# 手写的页面文本及预期清洗结果：(名称, 过滤器, 页面文本, 预期结果)，过滤器为 None 时使用默认过滤器
+FIXTURES = [
+    (
+        "段落中夹带广告",
+        None,
+        "第一章 试炼　　他拔出长剑，请收藏本站：https://www.qu02.cc。冲了上去。"
+        "　　夜色渐深https://www.qu02.cc/book/1/2.html，客栈里只剩下几盏油灯。"
+        "　　『点此报错』『加入书签』"
+        "　　灵气涌入经脉，\xa0丹田内一阵温热。天才一秒记住本站地址：www.qu02.cc。"
+        "　　他打开www.baidu.com搜索了一下，发现什么也没有。"
+        "　　请收藏本站：https://www.qu02.cc。笔趣阁手机版：https://m.qu02.cc　　『点此报错』『加入书签』",
+        "他拔出长剑，冲了上去。\n"
+        "夜色渐深，客栈里只剩下几盏油灯。\n"
+        "灵气涌入经脉， 丹田内一阵温热。\n"
+        "他打开搜索了一下，发现什么也没有。\n",
+    ),
+    (
+        "无网址的推广语",
+        None,
+        "第二章　　他说请收藏本站，转身离去。　　请收藏本站　　笔趣阁手机版：　　少年望向远方。　　尾1　　尾2",
+        "他说，转身离去。\n少年望向远方。\n",
+    ),
+    (
+        "重复段落",
+        None,
+        f"第三章　　{LONG_PARAGRAPH}　　{LONG_PARAGRAPH}　　啊！　　啊！　　{DIALOGUE}　　{DIALOGUE}　　​　　{LONG_PARAGRAPH}　　尾1　　尾2",
+        f"{LONG_PARAGRAPH}\n啊！\n啊！\n{DIALOGUE}\n{DIALOGUE}\n{LONG_PARAGRAPH}\n",
+    ),
+    ("奇数个全角空格", None, "第四章　　　第一段　　　第二段　　尾1　　尾2", "第一段\n第二段\n"),
+    ("奇数个全角空格在末尾", None, "第五章　　正文　　　尾1　　尾2", "正文\n"),
+    ("少于三个分隔符", None, "第六章　　正文　　尾", ""),
+    ("没有分隔符", None, "没有分隔符的页面", ""),
+    (
+        "多个过滤器的字符映射",
+        [ChapterFilter("a", chars={"A": "a", "B": "b"}), ChapterFilter("b", chars={"a": "B"})],
+        "标题　　A　　尾1　　尾2",
+        "B\n",
+    ),
+]
+
+# 清洗后不应残留的广告片段
+AD_SNIPPETS = AD_BANNERS + ["点此报错", "加入书签", "http", "www.", "qu02"]
+
+SENTENCES = [
+    "他们来了，脚步声在山谷中回荡。",
+    "少年抬起头，望向远处连绵的群山。",
+    "“这里不是你该来的地方。”老者缓缓说道。",
+    "灵气如潮水一般涌入经脉，\xa0丹田内一阵温热。",
+    "夜色渐深，客栈里只剩下几盏昏黄的油灯。",
+    "“啊！”",
+]
+
+# 计时用章节中夹带的广告，插在句子之间、段落末尾或单独成段
+ADS = [
+    "请收藏本站：https://www.qu02.cc。",
+    "笔趣阁手机版：https://m.qu02.cc",
+    "天才一秒记住本站地址：www.qu02.cc。",
+    "https://www.qu02.cc/book/12345/678.html",
+    "『点此报错』『加入书签』",
+    "请收藏本站",
+]
+
+FOOTER = [
+    "请收藏本站：https://www.qu02.cc。笔趣阁手机版：https://m.qu02.cc",
+    "『点此报错』『加入书签』",
+]
+
+
+def make_chapter(rng, paragraphs=60):
+    """生成一章计时用的模拟页面文本，包含广告、重复段落和不可见字符"""
+    parts = ["第一章 试炼"]
+    for _ in range(paragraphs):
+        sentences = [rng.choice(SENTENCES) for _ in range(rng.randint(1, 4))]
+        if rng.random() < 0.2:
+            sentences.insert(rng.randint(0, len(sentences)), rng.choice(ADS))
+        parts.extend(["".join(sentences)] * (2 if rng.random() < 0.05 else 1))
+        if rng.random() < 0.05:
+            parts.append(rng.choice(ADS))
+        if rng.random() < 0.03:
+            parts.append("​")
+    parts.extend(FOOTER)
+    return PARAGRAPH_SEP.join(parts)
+
+
+def check(fixtures):
+    """按手写的预期结果校验清洗结果，并确认没有残留广告"""
+    ok = True
+    for name, filters, page, expected in fixtures:
+        result = ChapterCleaner(filters).clean(page)
+        left = [s for s in AD_SNIPPETS if s in result]
+        if left or result != expected:
+            print(f"[{name}] 清洗结果错误，残留广告: {left}")
+            print(f"预期: {expected!r}")
+            print(f"实际: {result!r}")
+            ok = False
+    return ok
+
+
+def simplified_fixtures():
+    """繁体转简体的校验用例，未安装 OpenCC 时跳过"""
+    try:
+        to_simplified = simplified_filter()
+    except ImportError as e:
+        print(f"跳过繁体转简体校验: {e}")
+        return []
+    return [(
+        "繁体转简体",
+        [to_simplified] + DEFAULT_FILTERS,
+        "第七章　　這裡沒有人，他們說話聲音很大。請收藏本站：www.qu02.cc。　　尾1　　尾2",
+        "这里没有人，他们说话声音很大。\n",
+    )]
+
+
+def baseline(text):    # 原 download_chapter 的处理方式
+    content = []
+    content.extend(f"{i}\n" for i in text.split(PARAGRAPH_SEP)[1:-2])
+    return "".join(content)
+
+
+def bench(name, func, chapters, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for chapter in chapters:
+            func(chapter)
+        best = min(best, time.perf_counter() - start)
+    per_chapter = best / len(chapters) * 1e6
+    print(f"{name:<24}{per_chapter:>10.1f} µs/章{len(chapters) / best:>14.0f} 章/秒")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    fixtures = FIXTURES + simplified_fixtures()
+    if not check(fixtures):
+        sys.exit(1)
+    print(f"{len(fixtures)} 个手写用例校验通过")
+    rng = random.Random(0)
+    chapters = [make_chapter(rng) for _ in range(count)]
+    cleaner = ChapterCleaner()
+    with_ads = sum(any(m in cleaner.body(c) for m in AD_MARKERS) for c in chapters)
+    print(f"{count} 章，平均 {sum(map(len, chapters)) // count} 字符/章，{with_ads} 章正文含广告")
+    bench("baseline split", baseline, chapters)
+    bench("ChapterCleaner", cleaner.clean, chapters)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
 from colorama import init, Fore, Style
 from tqdm import tqdm
+from cleaner import DEFAULT_FILTERS, ChapterCleaner, simplified_filter
 
 # 基本配置
 BASE_URL = "https://www.qu02.cc/"  # 网站域名配置，方便后续修改
@@ -42,7 +43,7 @@ BASE_DIR = os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else
 DOWNLOAD_PATH = os.path.join(BASE_DIR, "bookstore")
 
 class NovelDownloader:
-    def __init__(self):
+    def __init__(self, simplified=False):
         self.session = requests.Session()
         self.session.headers.update(HEADERS)
         self.lock = Lock()
@@ -50,6 +51,8 @@ class NovelDownloader:
         self.total_chapters = 0
         self.current_progress = 0
         self.is_cancelled = False  # 添加取消标志
+        # 章节正文清洗，simplified=True 时额外做繁体转简体（需要 OpenCC）
+        self.cleaner = ChapterCleaner([simplified_filter()] + DEFAULT_FILTERS if simplified else DEFAULT_FILTERS)
         
     def cancel_download(self):
         self.is_cancelled = True
@@ -112,8 +115,7 @@ class NovelDownloader:
                 if not text:
                     raise ValueError("未找到章节内容")
                 
-                content = [f"\n\n{title}\n\n"]
-                content.extend(f"{i}\n" for i in text.get_text().split("　　")[1:-2])
+                content = f"\n\n{title}\n\n{self.cleaner.clean(text.get_text())}"
                 
                 with self.lock:
                     if self.is_cancelled:  # 检查是否已取消
@@ -124,7 +126,7 @@ class NovelDownloader:
                     else:
                         self.progress_bar.update(1)
                 
-                return index, title, "".join(content)
+                return index, title, content
                 
             except Exception as e:
                 if attempt == max_retries - 1:
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import re
+
+# 笔趣阁正文段落以两个全角空格缩进
+PARAGRAPH_SEP = "　　"
+
+# 站点广告、推广语
+# 网址只匹配 ASCII 字符：中文正文没有空格，\S、\w 会一直吞到段落末尾；
+# 左边界放在字面量之后判断，正则才能按前缀快速定位
+AD_URL = (
+    r"(?:https?://|www\.(?<![A-Za-z0-9]www\.)|m\.(?<![A-Za-z0-9]m\.))"
+    r"[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.(?:cc|com|net|org|la|info)(?![A-Za-z0-9-])"
+    r"(?:/[\x21-\x7e]*)?"
+)
+AD_BANNERS = ["请收藏本站", "笔趣阁手机版", "天才一秒记住本站地址"]
+AD_MARKERS = AD_BANNERS + ["『", "."]
+AD_PATTERNS = [
+    # 推广语后的网址可有可无
+    rf"(?:{'|'.join(AD_BANNERS)})(?:[：:] ?(?:{AD_URL})?)?[。.]?",
+    r"『点此报错』",
+    r"『加入书签』",
+    AD_URL,
+]
+# 各广告模式可能的首字符，作为前置断言让合并后的正则能按字符集快速跳过正文
+AD_FIRST_CHARS = "".join(b[0] for b in AD_BANNERS) + "『hwm"
+
+# 不可见或非常规空白字符
+WHITESPACE_CHARS = {
+    "\xa0": " ",
+    "\t": " ",
+    "\r": None,
+    "\u200b": None,
+    "\u200c": None,
+    "\u200d": None,
+    "\ufeff": None,
+}
+
+# 重复段落判定：短于该长度的段落或对白允许连续重复，如“啊！”
+DUPLICATE_MIN_LEN = 20
+DIALOGUE_QUOTES = ("“", "「", "『", '"', "‘")
+
+
+class ChapterFilter:
+    """章节清洗过滤器
+
+    chars: 字符映射表，键为单个字符，值为替换字符串，None 表示删除。
+        映射按键的顺序逐个替换，值中不能包含排在其后的键，否则会被再次替换；
+        多个过滤器的映射按过滤器顺序执行
+    convert: 整段正文转换函数 convert(text) -> text，如繁简转换
+    pattern: 需要整体删除的正则表达式
+    markers: pattern 可能命中时必然出现的字面量，均未出现时跳过正则扫描
+    keep: 段落判定函数 keep(paragraph, previous) -> bool，返回 False 时丢弃该段
+    """
+
+    def __init__(self, name, chars=None, convert=None, pattern=None, markers=None, keep=None):
+        if chars:
+            keys = list(chars)
+            for i, (k, v) in enumerate(chars.items()):
+                if len(k) != 1:
+                    raise ValueError(f"过滤器 {name} 的映射键必须是单个字符: {k!r}")
+                later = [c for c in keys[i + 1:] if v and c in v]
+                if later:
+                    raise ValueError(f"过滤器 {name} 中 {k!r} 的映射值包含后续的键 {later[0]!r}")
+        self.name = name
+        self.chars = chars
+        self.convert = convert
+        self.pattern = pattern
+        self.markers = markers
+        self.keep = keep
+
+
+def _keep_non_empty(paragraph, previous):
+    return bool(paragraph)
+
+
+def _keep_not_repeated(paragraph, previous):
+    if paragraph != previous or len(paragraph) < DUPLICATE_MIN_LEN:
+        return True
+    return paragraph.startswith(DIALOGUE_QUOTES)
+
+
+strip_ads = ChapterFilter(
+    "ads", pattern=f"(?=[{AD_FIRST_CHARS}])(?:{'|'.join(AD_PATTERNS)})", markers=AD_MARKERS
+)
+normalize_whitespace = ChapterFilter("whitespace", chars=WHITESPACE_CHARS, keep=_keep_non_empty)
+drop_duplicates = ChapterFilter("duplicates", keep=_keep_not_repeated)
+
+
+def simplified_filter(config="t2s"):
+    """繁体转简体过滤器，依赖 OpenCC（pip install opencc-python-reimplemented）"""
+    try:
+        import opencc
+    except ImportError:
+        raise ImportError("繁体转简体需要安装 OpenCC: pip install opencc-python-reimplemented") from None
+    return ChapterFilter("simplified", convert=opencc.OpenCC(config).convert)
+
+
+# 默认过滤器。drop_duplicates 只删除与上一段完全相同、长度不小于 DUPLICATE_MIN_LEN 的非对白段落，
+# 隔段重复或较短的重复段落会保留
+DEFAULT_FILTERS = [strip_ads, normalize_whitespace, drop_duplicates]
+
+
+class ChapterCleaner:
+    """按顺序执行一组过滤器的章节清洗流程
+
+    过滤器在构造时预先整理：字符映射按过滤器顺序排成一张替换表，删除模式合并为一个正则，
+    整段转换和段落判定函数按过滤器顺序执行。这不是单次遍历，每章依次经过：
+    截取正文 -> 逐个字符映射（先用 in 判断，命中才 replace）-> 整段转换 -> 标记字面量检查后执行删除正则
+    -> 按段落分隔符 split，逐段去除首尾空白并判定 -> 结果拼接一次。
+    在约 3000 字、正文夹带广告的章节上，耗时约为原 split 处理的 5～7 倍（约 0.1 ms/章，见 bench_clean.py）。
+    """
+
+    def __init__(self, filters=None):
+        self.filters = list(DEFAULT_FILTERS if filters is None else filters)
+        self.table = self._compile_table()
+        self.converts = tuple(f.convert for f in self.filters if f.convert)
+        patterns = [f"(?:{f.pattern})" for f in self.filters if f.pattern]
+        self.pattern = re.compile("|".join(patterns)) if patterns else None
+        # 任一删除模式未提供 markers 时，每章都需要执行正则
+        markers = [f.markers for f in self.filters if f.pattern]
+        self.markers = None if not all(markers) else tuple(m for ms in markers for m in ms)
+        self.keeps = tuple(f.keep for f in self.filters if f.keep)
+
+    def _compile_table(self):
+        # 按过滤器顺序依次排列各自的映射，逐个替换时等同于逐个执行过滤器，
+        # 前面过滤器的映射不会作用于后面过滤器产生的字符
+        return tuple((k, v or "") for f in self.filters if f.chars for k, v in f.chars.items())
+
+    def body(self, text):
+        """截取正文：首个段落分隔符之后、倒数第二个分隔符之前的文本，用于去掉章节标题和页尾推广
+
+        与 split(PARAGRAPH_SEP)[1:-2] 大体一致，但连续出现奇数个全角空格时分隔符的配对可能不同
+        """
+        start = text.find(PARAGRAPH_SEP)
+        end = text.rfind(PARAGRAPH_SEP)
+        end = text.rfind(PARAGRAPH_SEP, 0, end) if end > start else -1
+        if start < 0 or end <= start:
+            return None
+        return text[start + len(PARAGRAPH_SEP):end]
+
+    def _iter_clean(self, text):
+        for old, new in self.table:
+            if old in text:
+                text = text.replace(old, new)
+        for convert in self.converts:
+            text = convert(text)
+        if self.pattern and (self.markers is None or any(m in text for m in self.markers)):
+            text = self.pattern.sub("", text)
+
+        keeps = self.keeps
+        previous = None
+        for paragraph in text.split(PARAGRAPH_SEP):
+            paragraph = paragraph.strip()
+            for keep in keeps:
+                if not keep(paragraph, previous):
+                    break
+            else:
+                previous = paragraph
+                yield paragraph
+                yield "\n"
+
+    def clean(self, text):
+        """清洗章节原始文本，返回每段一行的正文"""
+        text = self.body(text)
+        if text is None:
+            return ""
+        return "".join(self._iter_clean(text))